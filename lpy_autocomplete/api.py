@@ -1,7 +1,10 @@
 """Expose lpy_autocomplete's API for IDE and metaprogramming use-cases."""
 
+import functools
+
 from .inspection import Inspect
 from .models import Candidate, Namespace, Prefix
+from .utils import clear_attr_cache
 
 
 class API:
@@ -29,7 +32,6 @@ class API:
         locals_: dict | None = None,
     ):
         self.set_namespace(globals_, locals_)
-        self._cached_prefix: Prefix | None = None
 
     def set_namespace(
         self,
@@ -45,6 +47,15 @@ class API:
             locals_  -> locals()
         """
         self.namespace = Namespace(globals_, locals_)
+        self._cached_prefix: Prefix | None = None
+
+        # Objects may have gained or lost attributes since the last namespace.
+        # The attribute cache is shared, so this refreshes every API instance.
+        clear_attr_cache()
+
+        # Lookups are only valid for the namespace they were made in
+        self._annotate_cached = functools.lru_cache(maxsize=512)(self._annotate)
+        self._inspect_cached = functools.lru_cache(maxsize=512)(self._inspect)
 
     def complete(self, prefix_str: str) -> tuple[str, ...]:
         """Get completions for a prefix string."""
@@ -56,6 +67,9 @@ class API:
 
     def annotate(self, candidate_str: str) -> str:
         """Annotate a candidate string."""
+        return self._annotate_cached(candidate_str)
+
+    def _annotate(self, candidate_str: str) -> str:
         candidate = Candidate(candidate_str, namespace=self.namespace)
         return candidate.annotate()
 
@@ -67,8 +81,8 @@ class API:
 
     def docs(self, candidate_str: str) -> str:
         """Get docstring for a candidate string."""
-        return self._inspect(candidate_str).docs()
+        return self._inspect_cached(candidate_str).docs()
 
     def full_docs(self, candidate_str: str) -> str:
         """Get full documentation for a candidate string."""
-        return self._inspect(candidate_str).full_docs()
+        return self._inspect_cached(candidate_str).full_docs()
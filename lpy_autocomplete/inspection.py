@@ -1,23 +1,60 @@
 """Implements argspec inspection and formatting for various types."""
 
+import functools
 import inspect
-from functools import reduce
+import re
 from typing import Any
 
 from .utils import unmangle
 
+# Unconditional conversions of built-in docs, applied in a single pass
+_REPLACEMENTS = {
+    "...": "* args",
+    "*args": "* args",
+    "**kwargs": "** kwargs",
+    "\n": "newline",
+    "-->": "- return",
+}
+_REPLACEMENTS_RE = re.compile(
+    "|".join(
+        re.escape(old) for old in sorted(_REPLACEMENTS, key=len, reverse=True)
+    )
+)
+
+
+def _replacement(match: re.Match) -> str:
+    return _REPLACEMENTS[match.group(0)]
+
+
+# Built-in docs as "pre(args)post", split in one pass
+_DOCS_RE = re.compile(r"(?P<pre>[^(]*)\((?P<args>[^)]*)\)(?P<post>.*)", re.DOTALL)
+
 
 class Parameter:
     """Represents a function parameter."""
 
+    __slots__ = ("symbol", "default", "_str")
+
     def __init__(self, symbol: str, default: Any = None):
         self.symbol = unmangle(symbol)
         self.default = default
+        # Formatted once, signatures stringify their parameters repeatedly
+        if default is None:
+            self._str = self.symbol
+        else:
+            self._str = f"[{self.symbol} {default}]"
 
     def __str__(self) -> str:
-        if self.default is None:
-            return self.symbol
-        return f"[{self.symbol} {self.default}]"
+        return self._str
+
+
+# Parameter kinds and sentinel, hoisted out of the per-parameter loop
+_EMPTY = inspect.Parameter.empty
+_KIND_POS = frozenset(
+    (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+)
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
 
 
 class Signature:
@@ -45,70 +82,51 @@ class Signature:
         kwargs_no_default = []
         kwargs_with_default = []
 
-        for name, param in sig.parameters.items():
+        for param in sig.parameters.values():
             kind = param.kind
-            has_default = param.default is not inspect.Parameter.empty
-            default_val = repr(param.default) if has_default else None
-
-            if kind == inspect.Parameter.POSITIONAL_ONLY:
-                if has_default:
-                    defaults.append(Parameter(name, default_val))
-                else:
-                    args.append(Parameter(name))
-            elif kind == inspect.Parameter.POSITIONAL_OR_KEYWORD:
-                if has_default:
-                    defaults.append(Parameter(name, default_val))
-                else:
-                    args.append(Parameter(name))
-            elif kind == inspect.Parameter.VAR_POSITIONAL:
-                self.varargs = [unmangle(name)]
-            elif kind == inspect.Parameter.KEYWORD_ONLY:
-                if has_default:
-                    kwargs_with_default.append(Parameter(name, default_val))
-                else:
-                    kwargs_no_default.append(Parameter(name))
-            elif kind == inspect.Parameter.VAR_KEYWORD:
-                self.varkw = [unmangle(name)]
+            if kind in _KIND_POS:
+                no_default, with_default = args, defaults
+            elif kind is _VAR_POSITIONAL:
+                self.varargs = [unmangle(param.name)]
+                continue
+            elif kind is _VAR_KEYWORD:
+                self.varkw = [unmangle(param.name)]
+                continue
+            else:
+                no_default, with_default = kwargs_no_default, kwargs_with_default
+
+            if param.default is _EMPTY:
+                no_default.append(Parameter(param.name))
+            else:
+                with_default.append(Parameter(param.name, repr(param.default)))
 
         self.args = tuple(args) if args else None
         self.defaults = tuple(defaults) if defaults else None
         self.kwargs = tuple(kwargs_no_default + kwargs_with_default)
 
     @staticmethod
-    def _format_args(args: tuple | None, opener: str | None) -> str:
+    def _format_group(args: tuple | list | None, opener: str | None) -> str:
         if not args:
             return ""
-        args_str = " ".join(str(a) for a in args)
-        opener_str = f"{opener} " if opener else ""
-        return opener_str + args_str
+        body = " ".join([str(a) for a in args])
+        return f"{opener} {body}" if opener else body
 
-    @classmethod
-    def _acc_lispy_repr(cls, acc: str, args_opener: tuple) -> str:
-        args, opener = args_opener
-        delim = " " if acc and args else ""
-        return acc + delim + cls._format_args(args, opener)
-
-    @property
-    def _arg_opener_pairs(self) -> list[tuple]:
-        return [
+    def __str__(self) -> str:
+        groups = []
+        for args, opener in (
             (self.args, None),
             (self.defaults, "&optional"),
             (self.varargs, "*"),
             (self.varkw, "**"),
             (self.kwargs, "&kwonly"),
-        ]
-
-    def __str__(self) -> str:
-        return reduce(self._acc_lispy_repr, self._arg_opener_pairs, "")
-
-
-def _split_docs(docs: str) -> tuple[str, str, str]:
-    """Partition docs string into pre/-/post-args strings."""
-    arg_start = docs.index("(") + 1
-    arg_end = docs.index(")")
-    return (docs[:arg_start], docs[arg_start:arg_end], docs[arg_end:])
+        ):
+            group = self._format_group(args, opener)
+            if group:
+                groups.append(group)
+        return " ".join(groups)
 
 
+@functools.lru_cache(maxsize=1024)
 def _argstring_to_param(arg_string: str) -> Parameter:
     """Convert an arg string to a Parameter."""
     if "=" not in arg_string:
@@ -136,59 +154,74 @@ def _insert_optional(args: list[str]) -> list[str]:
     return args
 
 
+@functools.lru_cache(maxsize=1024)
 def builtin_docs_to_lispy_docs(docs: str) -> str:
     """Convert built-in-styled docs string into a lispy-format."""
+    # Perform unconditional conversions, none of which touch parens
+    formatted = _REPLACEMENTS_RE.sub(_replacement, docs)
+
     # Check if docs is non-standard
-    if "(" not in docs or ")" not in docs:
+    match = _DOCS_RE.match(formatted)
+    if match is None:
         return docs
-
-    replacements = [
-        ("...", "* args"),
-        ("*args", "* args"),
-        ("**kwargs", "** kwargs"),
-        ("\n", "newline"),
-        ("-->", "- return"),
-    ]
-
-    pre_args, _, post_args = docs.partition("(")
-
-    # Format before args and perform unconditional conversions
-    formatted = f"{pre_args}: ({post_args}"
-    for old, new in replacements:
-        formatted = formatted.replace(old, new)
-
-    pre_args, args, post_args = _split_docs(formatted)
+    pre_args, args, post_args = match["pre"], match["args"], match["post"]
 
     # Format and reorder args and reconstruct the string
     args_list = [a.strip() for a in args.split(",")]
     args_list = _insert_optional(args_list)
     args_formatted = " ".join(str(_argstring_to_param(a)) for a in args_list)
 
-    return pre_args + args_formatted + post_args
+    return f"{pre_args}: ({args_formatted}){post_args}"
+
+
+_METHOD_WRAPPER_TYPE = type(print.__str__)
+
+# Sentinel for a not-yet-computed signature (None means unsupported)
+_MISSING = object()
 
 
 class Inspect:
     """High-level introspection for objects."""
 
+    __slots__ = (
+        "obj",
+        "_is_class",
+        "_is_method_wrapper",
+        "_doc",
+        "_docs_first_line",
+        "_is_compile_table",
+        "_signature",
+        "_docs_memo",
+        "_full_docs_memo",
+    )
+
     def __init__(self, obj: Any):
         self.obj = obj
 
-    @property
-    def _docs_first_line(self) -> str:
-        if self.obj.__doc__:
-            return self.obj.__doc__.splitlines()[0]
-        return ""
+        # Precomputed, formatting consults these several times per docs()
+        self._is_class = inspect.isclass(obj)
+        self._is_method_wrapper = isinstance(obj, _METHOD_WRAPPER_TYPE)
+        self._doc = obj.__doc__ or ""
+        # Only the first line is needed for docs(), don't split the rest
+        first_line = self._doc.partition("\n")[0]
+        self._docs_first_line = first_line.splitlines()[0] if first_line else ""
+        self._is_compile_table = (
+            self._docs_first_line == "Built-in immutable sequence."
+        )
+
+        # Memoized on the instance; API caches Inspects per namespace, so
+        # these are dropped along with it by set_namespace
+        self._signature: Any = _MISSING
+        self._docs_memo: str | None = None
+        self._full_docs_memo: str | None = None
 
     @property
     def _docs_rest_lines(self) -> str:
-        if self.obj.__doc__:
-            lines = self.obj.__doc__.splitlines()[1:]
-            return "\n".join(lines)
-        return ""
+        return "\n".join(self._doc.splitlines()[1:])
 
     @property
     def _args_docs_delim(self) -> str:
-        if self.obj.__doc__:
+        if self._doc:
             return " - "
         return ""
 
@@ -220,27 +253,40 @@ class Inspect:
     @property
     def is_class(self) -> bool:
         """Is object a class?"""
-        return inspect.isclass(self.obj)
+        return self._is_class
 
     @property
     def is_method_wrapper(self) -> bool:
         """Is object of type 'method-wrapper'?"""
-        return isinstance(self.obj, type(print.__str__))
+        return self._is_method_wrapper
 
     @property
     def is_compile_table(self) -> bool:
         """Is object a compile table construct?"""
-        return self._docs_first_line == "Built-in immutable sequence."
+        return self._is_compile_table
 
     def signature(self) -> Signature | None:
         """Return object's signature if it exists."""
-        try:
-            return Signature(self.obj)
-        except TypeError:
-            return None
+        if self._signature is _MISSING:
+            try:
+                self._signature = Signature(self.obj)
+            except TypeError:
+                self._signature = None
+        return self._signature
 
     def docs(self) -> str:
         """Formatted first line docs for object."""
+        if self._docs_memo is None:
+            self._docs_memo = self._docs()
+        return self._docs_memo
+
+    def full_docs(self) -> str:
+        """Formatted full docs for object."""
+        if self._full_docs_memo is None:
+            self._full_docs_memo = self._full_docs()
+        return self._full_docs_memo
+
+    def _docs(self) -> str:
         sig = self.signature()
 
         if sig and not self.is_compile_table:
@@ -255,8 +301,7 @@ class Inspect:
 
         return self._format_docs(formatted)
 
-    def full_docs(self) -> str:
-        """Formatted full docs for object."""
+    def _full_docs(self) -> str:
         if self.is_compile_table:
             return ""
         if self._docs_rest_lines:
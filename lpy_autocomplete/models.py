@@ -1,7 +1,9 @@
 """Implements Namespace-dependent methods and structures for lpy_autocomplete."""
 
+import functools
 import keyword
 
+from collections import ChainMap
 from collections.abc import Callable
 from typing import Any
 
@@ -10,20 +12,44 @@ KEYWORDS = frozenset(keyword.kwlist) | {"ife", "defmacro", "require"}
 
 from .utils import (
     allkeys,
-    butlast,
-    chain,
-    distinct,
+    cached_attrs,
     first,
     flip,
-    last,
     mangle,
     unmangle,
+    words_with_prefix,
 )
 
+# Sentinel for not-yet-computed cached values
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_eval(source: str) -> Any:
+    """Compile source for eval, once per distinct source."""
+    return compile(source, "<lpy-autocomplete>", "eval")
+
 
 class Namespace:
     """Represents the execution namespace for completion."""
 
+    __slots__ = (
+        "globals",
+        "locals",
+        "_scope",
+        "macros",
+        "names",
+        "_name_set",
+        "_sorted_names",
+        "_eval_cached",
+    )
+
+    # Collected names, their set and sorted tuple, keyed on the key sets they
+    # were built from. Kept on the class: the default globals are this
+    # module's, and dicts there would be collected as names.
+    _NAMES_CACHE_SIZE = 32
+    _names_cache: dict[tuple, tuple[tuple[str, ...], frozenset, tuple]] = {}
+
     def __init__(
         self,
         globals_: dict | None = None,
@@ -33,43 +59,88 @@ class Namespace:
         self.globals = globals_ if globals_ is not None else globals()
         self.locals = locals_ if locals_ is not None else locals()
 
+        # Names resolve in globals first, then locals
+        self._scope = ChainMap(self.globals, self.locals)
+
         # Macros are stored in __macro_namespace in lispython
         macro_ns = self.globals.get("__macro_namespace", {})
         self.macros = {unmangle(k): v for k, v in macro_ns.items()}
 
         # Collected names
-        self.names = self._collect_names()
+        (
+            self.names,
+            self._name_set,
+            self._sorted_names,
+        ) = self._lookup_names()
 
-    @staticmethod
-    def _to_names(key: Any) -> str:
-        """Convert keys (strs, functions, modules...) to names."""
-        if isinstance(key, str):
-            return unmangle(key)
-        return unmangle(key.__name__)
-
-    def _collect_names(self) -> tuple[str, ...]:
-        """Collect all names from all places."""
-        all_keys = chain(
+        # Successive prefixes re-evaluate the same candidates
+        self._eval_cached = functools.lru_cache(maxsize=256)(self._eval)
+
+    def _collect_names(
+        self,
+        global_keys: tuple,
+        local_keys: tuple,
+    ) -> tuple[str, ...]:
+        """Collect all names from all places.
+
+        Keys are strs, or functions, modules... converted by their __name__.
+        """
+        _unmangle, _isinstance, _str = unmangle, isinstance, str
+        seen: set[str] = set()
+        names: list[str] = []
+        add_seen, add_name = seen.add, names.append
+        for keys in (
             KEYWORDS,
-            allkeys(self.globals),
-            allkeys(self.locals),
-            self.macros.keys(),
+            global_keys,
+            local_keys,
+            self.macros,
+        ):
+            for key in keys:
+                name = _unmangle(key if _isinstance(key, _str) else key.__name__)
+                if name not in seen:
+                    add_seen(name)
+                    add_name(name)
+        return tuple(names)
+
+    def _lookup_names(self) -> tuple[tuple[str, ...], frozenset, tuple]:
+        """Collected names, their set and sorted tuple, reused while unchanged."""
+        # Keyed on every key collected, nested dict keys included
+        global_keys = allkeys(self.globals)
+        local_keys = allkeys(self.locals)
+        key = (
+            frozenset(global_keys),
+            frozenset(local_keys),
+            frozenset(self.macros),
         )
-        return tuple(distinct(map(self._to_names, all_keys)))
+        cache = Namespace._names_cache
+        entry = cache.get(key)
+        if entry is None:
+            names = self._collect_names(global_keys, local_keys)
+            entry = (names, frozenset(names), tuple(sorted(names)))
+            if len(cache) >= self._NAMES_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = entry
+        return entry
+
+    def __contains__(self, name: str) -> bool:
+        """Is name one of the collected names?"""
+        return name in self._name_set
+
+    def names_with_prefix(self, prefix: str) -> tuple[str, ...]:
+        """Collected names starting with prefix."""
+        return words_with_prefix(self._sorted_names, prefix)
 
     def eval(self, mangled_symbol: str) -> Any:
         """Evaluate mangled_symbol within the Namespace."""
+        return self._eval_cached(mangled_symbol)
+
+    def _eval(self, mangled_symbol: str) -> Any:
         # Short circuit common case (completing without "." present)
         if not mangled_symbol:
             return None
 
         try:
-            return eval(mangled_symbol, self.globals)
-        except NameError:
-            try:
-                return eval(mangled_symbol, self.locals)
-            except Exception:
-                return None
+            return eval(_compile_eval(mangled_symbol), self.globals, self._scope)
         except Exception:
             return None
 
@@ -77,10 +148,13 @@ class Namespace:
 class Candidate:
     """Represents a completion candidate."""
 
+    __slots__ = ("symbol", "mangled", "namespace", "_evaled_cache")
+
     def __init__(self, symbol: str, namespace: Namespace | None = None):
         self.symbol = unmangle(symbol)
         self.mangled = mangle(symbol)
         self.namespace = namespace if namespace is not None else Namespace()
+        self._evaled_cache: Any = _MISSING
 
     def __str__(self) -> str:
         return self.symbol
@@ -102,10 +176,12 @@ class Candidate:
 
     def evaled(self) -> Any:
         """Is candidate evaluatable? Return it if so."""
-        try:
-            return self.namespace.eval(self.mangled)
-        except Exception:
-            return None
+        if self._evaled_cache is _MISSING:
+            try:
+                self._evaled_cache = self.namespace.eval(self.mangled)
+            except Exception:
+                self._evaled_cache = None
+        return self._evaled_cache
 
     def get_obj(self) -> Any:
         """Get object for underlying candidate."""
@@ -115,7 +191,7 @@ class Candidate:
         """Return attributes for obj if they exist."""
         obj = self.evaled()
         if obj is not None:
-            return tuple(unmangle(attr) for attr in dir(obj))
+            return cached_attrs(obj)
         return None
 
     @staticmethod
@@ -147,33 +223,43 @@ class Candidate:
         return f"<{annotation} {self}>"
 
 
+# Candidate of prefixes without a dot; it never evaluates, so it needs no
+# real namespace
+_EMPTY_CANDIDATE = Candidate("", namespace=Namespace(globals_={}, locals_={}))
+
+
 class Prefix:
     """A completion prefix."""
 
+    __slots__ = (
+        "prefix",
+        "namespace",
+        "candidate",
+        "attr_prefix",
+        "completions",
+        "_sorted_completions",
+        "_last_result",
+    )
+
     def __init__(self, prefix: str, namespace: Namespace | None = None):
         self.prefix = prefix
         self.namespace = namespace if namespace is not None else Namespace()
 
-        self.candidate = self._prefix_to_candidate(prefix, self.namespace)
-        self.attr_prefix = self._prefix_to_attr_prefix(prefix)
+        # Candidate is everything before the last dot, attr prefix after it
+        head, dot, tail = prefix.rpartition(".")
+        if dot:
+            self.candidate = Candidate(head, namespace=self.namespace)
+        else:
+            self.candidate = _EMPTY_CANDIDATE
+        self.attr_prefix = unmangle(tail)
 
         self.completions: tuple[str, ...] = tuple()
+        self._sorted_completions: tuple[str, ...] | None = None
+        self._last_result: tuple[str, ...] | None = None
 
     def __repr__(self) -> str:
         return f"Prefix<prefix={self.prefix}>"
 
-    @staticmethod
-    def _prefix_to_candidate(prefix: str, namespace: Namespace) -> Candidate:
-        """Extract candidate from prefix (everything before last dot)."""
-        parts = prefix.split(".")
-        candidate_str = ".".join(butlast(parts))
-        return Candidate(candidate_str, namespace=namespace)
-
-    @staticmethod
-    def _prefix_to_attr_prefix(prefix: str) -> str:
-        """Get prefix as str of everything after last dot."""
-        return unmangle(last(prefix.split(".")))
-
     @property
     def has_attr(self) -> bool:
         """Does prefix reference an attr?"""
@@ -190,23 +276,61 @@ class Prefix:
             return f"{self.candidate}.{completion}"
         return completion
 
+    def _attach_candidate(self, completions: tuple[str, ...]) -> tuple[str, ...]:
+        """complete_candidate over completions, formatting the head once."""
+        if not self.candidate:
+            return completions
+        head = f"{self.candidate}."
+        return tuple([head + completion for completion in completions])
+
+    def _extends(self, cached_prefix: "Prefix") -> bool:
+        """Does this prefix only append to cached_prefix's attr prefix?"""
+        return (
+            cached_prefix._last_result is not None
+            and cached_prefix.namespace is self.namespace
+            and self.candidate == cached_prefix.candidate
+            and self.attr_prefix.startswith(cached_prefix.attr_prefix)
+        )
+
     def complete(self, cached_prefix: "Prefix | None" = None) -> tuple[str, ...]:
         """Get candidates for a given Prefix."""
+        # Incremental typing: the previous result is a superset of this one
+        if cached_prefix and self._extends(cached_prefix):
+            self.completions = cached_prefix.completions
+            self._sorted_completions = cached_prefix._sorted_completions
+            previous = cached_prefix._last_result
+            if self.attr_prefix == cached_prefix.attr_prefix:
+                self._last_result = previous
+            else:
+                completed = self.complete_candidate(self.attr_prefix)
+                self._last_result = tuple(
+                    [c for c in previous if c.startswith(completed)]
+                )
+            return self._last_result
+
         # Short circuit case: "1+nonsense.real-attr" eg. "foo.__prin"
         if self.has_attr and not self.has_obj:
             self.completions = tuple()
+            self._last_result = self.completions
             return self.completions
 
         # Complete on relevant top-level names or candidate-dependent names
         if cached_prefix and self.candidate == cached_prefix.candidate:
             self.completions = cached_prefix.completions
+            self._sorted_completions = cached_prefix._sorted_completions
         else:
             attrs = self.candidate.attributes()
             self.completions = attrs if attrs else self.namespace.names
 
         # Filter by prefix and attach to candidate
-        filtered = filter(
-            lambda c: c.startswith(self.attr_prefix),
-            self.completions,
-        )
-        return tuple(map(self.complete_candidate, filtered))
+        if self.completions is self.namespace.names:
+            filtered = self.namespace.names_with_prefix(self.attr_prefix)
+        else:
+            # Sorted lazily and shared via cached_prefix
+            if self._sorted_completions is None:
+                self._sorted_completions = tuple(sorted(self.completions))
+            filtered = words_with_prefix(
+                self._sorted_completions, self.attr_prefix
+            )
+        self._last_result = self._attach_candidate(filtered)
+        return self._last_result
@@ -1,46 +1,98 @@
 """Utility functions for lpy_autocomplete."""
 
+import bisect
+import collections
 import functools
 import itertools
+import sys
 from collections.abc import Callable, Iterable, Iterator
 from typing import Any, TypeVar
 
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=4096)
 def mangle(s: str) -> str:
     """Convert lispy symbol to Python identifier.
 
     In lispython, this just converts hyphens to underscores.
+    Results are interned, so equal symbols share one string object.
     """
     if not s:
         return ""
-    return s.replace("-", "_")
+    return sys.intern(s.replace("-", "_"))
 
 
+_UNMANGLE_TABLE = str.maketrans("_", "-")
+
+
+@functools.lru_cache(maxsize=4096)
 def unmangle(s: str) -> str:
     """Convert Python identifier to lispy symbol.
 
     In lispython, this converts underscores to hyphens,
     but preserves leading and trailing underscores (e.g., __call__, _private).
+    Results are interned, so equal symbols share one string object.
     """
     if not s:
         return ""
 
-    # Count and strip leading underscores
-    leading = len(s) - len(s.lstrip("_"))
-    # Count and strip trailing underscores
-    trailing = len(s) - len(s.rstrip("_"))
+    # Find the leading underscores
+    n = len(s)
+    i = 0
+    while i < n and s[i] == "_":
+        i += 1
 
     # Handle all-underscore strings
-    if leading + trailing >= len(s):
-        return s
+    if i == n:
+        return sys.intern(str(s))
+
+    # Find the trailing underscores, the middle has a non-underscore
+    j = n
+    while s[j - 1] == "_":
+        j -= 1
+
+    return sys.intern(s[:i] + s[i:j].translate(_UNMANGLE_TABLE) + s[j:])
+
+
+class IdentityKey:
+    """Hashable wrapper comparing the wrapped object by identity.
+
+    Lets arbitrary (possibly unhashable) objects key an lru_cache. The wrapper
+    holds a strong reference, so the id cannot be reused while it is cached.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, IdentityKey) and other.obj is self.obj
+
+
+@functools.lru_cache(maxsize=1024)
+def _dir_unmangled(key: IdentityKey) -> tuple[str, ...]:
+    return tuple(unmangle(name) for name in dir(key.obj))
+
+
+def cached_attrs(obj: Any) -> tuple[str, ...]:
+    """Unmangled attribute names of obj, cached per object.
+
+    Objects may gain attributes, call clear_attr_cache() to refresh.
+    """
+    return _dir_unmangled(IdentityKey(obj))
 
-    # Extract middle part and convert
-    middle = s[leading : len(s) - trailing if trailing else None]
-    middle = middle.replace("_", "-")
 
-    return "_" * leading + middle + "_" * trailing
+def clear_attr_cache() -> None:
+    """Clear the cached_attrs cache.
+
+    The cache is process-global: this clears it for every API instance.
+    """
+    _dir_unmangled.cache_clear()
 
 
 def is_none(x: Any) -> bool:
@@ -48,19 +100,38 @@ def is_none(x: Any) -> bool:
     return x is None
 
 
-def is_string(x: Any) -> bool:
-    """Check if x is a string."""
-    return isinstance(x, str)
+def _make_is_string() -> Callable[[Any], bool]:
+    # Closure cells for isinstance/str instead of global lookups per call
+    _isinstance, _str = isinstance, str
+
+    def is_string(x: Any) -> bool:
+        """Check if x is a string."""
+        return _isinstance(x, _str)
+
+    return is_string
+
+
+is_string = _make_is_string()
 
 
 def first(coll: Iterable[T]) -> T | None:
     """Return first item from collection."""
+    if isinstance(coll, (list, tuple)):
+        return coll[0] if coll else None
     return next(iter(coll), None)
 
 
-def last(coll: Iterable[T]) -> T:
-    """Return last item from collection."""
-    return tuple(coll)[-1]
+def last(coll: Iterable[T]) -> T | None:
+    """Return last item from collection.
+
+    Like first, returns None for an empty collection (it used to raise
+    IndexError).
+    """
+    if isinstance(coll, (list, tuple)):
+        return coll[-1] if coll else None
+    # Consume iterators keeping only the last item
+    tail = collections.deque(coll, maxlen=1)
+    return tail[0] if tail else None
 
 
 def drop(count: int, coll: Iterable[T]) -> Iterator[T]:
@@ -70,8 +141,18 @@ def drop(count: int, coll: Iterable[T]) -> Iterator[T]:
 
 def drop_last(count: int, coll: Iterable[T]) -> list[T]:
     """Drop last count elements from collection."""
-    lst = list(coll)
-    return lst[:-count] if count > 0 else lst
+    if count <= 0:
+        return list(coll)
+
+    # Hold back a window of the last count elements seen
+    it = iter(coll)
+    window = collections.deque(itertools.islice(it, count), maxlen=count)
+    result = []
+    add_result, pop_window, push_window = result.append, window.popleft, window.append
+    for item in it:
+        add_result(pop_window())
+        push_window(item)
+    return result
 
 
 def butlast(coll: Iterable[T]) -> list[T]:
@@ -81,25 +162,50 @@ def butlast(coll: Iterable[T]) -> list[T]:
 
 def allkeys(d: dict) -> tuple[str, ...]:
     """Get all keys from a possibly nested dict, flattened."""
-    def _allkeys(d: Any, parents: tuple = ()) -> list:
-        if isinstance(d, (list, tuple)):
-            return []
-        result = []
-        for k, v in d.items():
-            new_key = parents + (k,)
-            if isinstance(v, dict):
-                result.extend(_allkeys(v, new_key))
-            else:
-                result.append(new_key)
-        return result
-
-    return tuple(last(k) for k in _allkeys(d))
+    items = getattr(d, "items", None)
+    if items is None:
+        return ()
+
+    # Locals for the builtins and methods used per key
+    _isinstance, _dict, _iter, _id = isinstance, dict, iter, id
+    keys = []
+    add_key = keys.append
+
+    # Explicit stack of item iterators, keeping keys in depth-first order,
+    # and the ids of the dicts on it, so self-containing dicts terminate.
+    # Dicts merely shared between branches are walked each time.
+    stack = [_iter(items())]
+    path = [_id(d)]
+    on_path = set(path)
+    while stack:
+        for k, v in stack[-1]:
+            # Dict subclasses (defaultdict, OrderedDict...) are walked too
+            if _isinstance(v, _dict):
+                if _id(v) not in on_path:
+                    stack.append(_iter(v.items()))
+                    path.append(_id(v))
+                    on_path.add(_id(v))
+                    break
+                continue
+            add_key(k)
+        else:
+            stack.pop()
+            on_path.discard(path.pop())
+    return tuple(keys)
+
+
+def juxt_lazy(*funcs: Callable) -> Callable:
+    """Return a function that applies each func to args, yielding results."""
+    def inner(*args, **kwargs):
+        return (f(*args, **kwargs) for f in funcs)
+    return inner
 
 
 def juxt(*funcs: Callable) -> Callable:
     """Return a function that applies each func to args, collecting results."""
+    lazy = juxt_lazy(*funcs)
     def inner(*args, **kwargs):
-        return [f(*args, **kwargs) for f in funcs]
+        return list(lazy(*args, **kwargs))
     return inner
 
 
@@ -107,12 +213,13 @@ def flip(func: Callable) -> Callable:
     """Return a function with arguments flipped."""
     @functools.wraps(func)
     def flipped(*args, **kwargs):
-        return func(*reversed(args), **kwargs)
+        return func(*args[::-1], **kwargs)
     return flipped
 
 
 # Re-exports from itertools/functools
 chain = itertools.chain
+flatten = itertools.chain.from_iterable  # Flatten one level of nesting
 islice = itertools.islice
 reduce = functools.reduce
 remove = itertools.filterfalse
@@ -122,12 +229,30 @@ repeat = itertools.repeat
 def distinct(iterable: Iterable[T]) -> Iterator[T]:
     """Yield unique elements, preserving order."""
     seen: set = set()
+    add_seen = seen.add
     for item in iterable:
         if item not in seen:
-            seen.add(item)
+            add_seen(item)
             yield item
 
 
-def flatten(iterables: Iterable[Iterable[T]]) -> Iterator[T]:
-    """Flatten one level of nesting."""
-    return itertools.chain.from_iterable(iterables)
+def words_with_prefix(
+    sorted_words: tuple[str, ...], prefix: str
+) -> tuple[str, ...]:
+    """Return all words in a sorted tuple starting with prefix.
+
+    Such words form one contiguous run, located by bisection.
+    """
+    if not prefix:
+        return sorted_words
+    lo = bisect.bisect_left(sorted_words, prefix)
+
+    # First word past the run: prefix with its last char incremented. A
+    # trailing U+10FFFF can't be incremented, but every word sorting between
+    # the prefix and its shorter stem incremented must share the prefix.
+    stem = prefix.rstrip(chr(sys.maxunicode))
+    if not stem:
+        return sorted_words[lo:]
+    bound = stem[:-1] + chr(ord(stem[-1]) + 1)
+    hi = bisect.bisect_left(sorted_words, bound, lo)
+    return sorted_words[lo:hi]
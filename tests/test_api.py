@@ -1,5 +1,8 @@
 """Tests for lpy_autocomplete.api"""
 
+import gc
+import weakref
+
 import pytest
 from lpy_autocomplete import API
 
@@ -76,6 +79,12 @@ class TestAPI:
         ann = api.annotate("my_var")
         assert ann == "<instance my-var>"
 
+    def test_annotate_after_set_namespace(self):
+        api = API(globals_={"thing": 42})
+        assert api.annotate("thing") == "<instance thing>"
+        api.set_namespace(globals_={"thing": len})
+        assert api.annotate("thing") == "<function thing>"
+
     def test_docs_function(self):
         api = API()
         docs = api.docs("print")
@@ -108,3 +117,56 @@ class TestAPI:
 
         assert len(c2) < len(c1)
         assert all(c.startswith("print.__c") for c in c2)
+
+    def test_incremental_matches_fresh(self):
+        api = API()
+        api.complete("print.")
+        narrowed = api.complete("print.__c")
+        assert set(narrowed) == set(API().complete("print.__c"))
+
+    def test_incremental_backspace(self):
+        api = API()
+        api.complete("print.__c")
+        widened = api.complete("print.__")
+        assert "print.__call__" in widened
+        assert "print.__str__" in widened
+
+    def test_set_namespace_resets_cache(self):
+        api = API(globals_={"old_var": 1})
+        assert api.complete("old") == ("old-var",)
+        api.set_namespace(globals_={"older_var": 1})
+        assert api.complete("old") == ("older-var",)
+
+    def test_set_namespace_refreshes_attributes(self):
+        class Box:
+            pass
+        box = Box()
+        api = API(locals_={"box": box})
+        assert api.complete("box.new") == ()
+        box.new_attr = 1
+        api.set_namespace(locals_={"box": box})
+        assert api.complete("box.new") == ("box.new-attr",)
+
+    def test_set_namespace_refreshes_docs(self):
+        def func():
+            """Old doc."""
+        api = API(locals_={"func": func})
+        assert "Old doc." in api.docs("func")
+        func.__doc__ = "New doc."
+        api.set_namespace(locals_={"func": func})
+        assert "New doc." in api.docs("func")
+
+    def test_set_namespace_releases_objects(self):
+        class Documented:
+            """Doc."""
+        obj = Documented()
+        ref = weakref.ref(obj)
+        api = API(globals_={}, locals_={"obj": obj})
+        api.docs("obj")
+        api.full_docs("obj")
+        api.annotate("obj")
+        api.complete("obj.")
+        del obj
+        api.set_namespace(globals_={}, locals_={})
+        gc.collect()
+        assert ref() is None
@@ -27,6 +27,40 @@ class TestNamespace:
         assert "my-macro" in ns.macros
         assert "another-macro" in ns.macros
 
+    def test_namespace_contains(self):
+        ns = Namespace(globals_={"my_var": 1})
+        assert "my-var" in ns
+        assert "print" not in ns
+        assert "if" in ns
+
+    def test_namespace_names_track_changes(self):
+        globals_ = {"first_var": 1}
+        locals_ = {}
+        assert "first-var" in Namespace(globals_, locals_).names
+        globals_["second_var"] = 2
+        assert "second-var" in Namespace(globals_, locals_).names
+        # Same dicts at the same size, but a different key
+        del globals_["first_var"]
+        globals_["third_var"] = 3
+        ns = Namespace(globals_, locals_)
+        assert "third-var" in ns.names
+        assert "first-var" not in ns.names
+
+    def test_namespace_names_track_nested_changes(self):
+        globals_ = {"cfg": {"alpha": 1}, "val": 1}
+        assert "alpha" in Namespace(globals_, {}).names
+        globals_["cfg"]["beta"] = 2
+        globals_["val"] = {"inner": 1}
+        ns = Namespace(globals_, {})
+        assert "beta" in ns.names
+        assert "inner" in ns.names
+        assert "val" not in ns.names
+
+    def test_namespace_names_with_prefix(self):
+        ns = Namespace(globals_={"my_var": 1, "my_other": 2, "other": 3})
+        assert set(ns.names_with_prefix("my-")) == {"my-var", "my-other"}
+        assert ns.names_with_prefix("xyz") == ()
+
     def test_namespace_eval_builtin(self):
         ns = Namespace()
         assert ns.eval("print") is print
@@ -45,6 +79,18 @@ class TestNamespace:
         ns = Namespace(locals_=locals())
         assert ns.eval("my_var") == "hello"
 
+    def test_namespace_eval_prefers_globals(self):
+        ns = Namespace(globals_={"shared": "global"}, locals_={"shared": "local"})
+        assert ns.eval("shared") == "global"
+
+    def test_namespace_eval_locals_attribute(self):
+        ns = Namespace(globals_={}, locals_={"text": "hello"})
+        assert ns.eval("text.upper") is not None
+
+    def test_namespace_eval_syntax_error(self):
+        ns = Namespace()
+        assert ns.eval("1+") is None
+
 
 class TestCandidate:
     """Tests for Candidate class."""
@@ -83,6 +129,22 @@ class TestCandidate:
         c = Candidate("my_obj", namespace=ns)
         assert c.evaled() == {"key": "value"}
 
+    def test_candidate_evaled_once(self):
+        class Counted:
+            calls = 0
+
+            @property
+            def value(self):
+                Counted.calls += 1
+                return 1
+
+        ns = Namespace(locals_={"obj": Counted()})
+        c = Candidate("obj.value", namespace=ns)
+        c.get_obj()
+        c.attributes()
+        Candidate("obj.value", namespace=ns).evaled()
+        assert Counted.calls == 1
+
     def test_candidate_attributes_builtin(self):
         c = Candidate("print")
         attrs = c.attributes()
@@ -90,6 +152,9 @@ class TestCandidate:
         assert "__call__" in attrs
         assert "__str__" in attrs
 
+    def test_candidate_attributes_reused(self):
+        assert Candidate("print").attributes() is Candidate("print").attributes()
+
     def test_candidate_attributes_nonexistent(self):
         c = Candidate("doesnt_exist")
         assert c.attributes() is None
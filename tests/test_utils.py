@@ -1,5 +1,9 @@
 """Tests for lpy_autocomplete.utils"""
 
+import itertools
+import sys
+from collections import OrderedDict, defaultdict
+
 import pytest
 from lpy_autocomplete.utils import (
     mangle,
@@ -12,6 +16,13 @@ from lpy_autocomplete.utils import (
     allkeys,
     distinct,
     flatten,
+    words_with_prefix,
+    IdentityKey,
+    juxt,
+    juxt_lazy,
+    flip,
+    cached_attrs,
+    clear_attr_cache,
 )
 
 
@@ -56,6 +67,16 @@ class TestUnmangle:
         assert unmangle("__some_func__") == "__some-func__"
         assert unmangle("_my_var_") == "_my-var_"
 
+    def test_str_subclass(self):
+        class S(str):
+            pass
+        assert unmangle(S("__")) == "__"
+        assert unmangle(S("my_var")) == "my-var"
+        assert mangle(S("my-var")) == "my_var"
+
+    def test_interned(self):
+        assert unmangle("interned_sym") is sys.intern("interned-sym")
+
     def test_all_underscores(self):
         assert unmangle("_") == "_"
         assert unmangle("__") == "__"
@@ -80,6 +101,18 @@ class TestLast:
     def test_single(self):
         assert last([42]) == 42
 
+    def test_empty(self):
+        # Empty collections give None, matching first(), not IndexError
+        assert last([]) is None
+        assert last(()) is None
+        assert last(iter([])) is None
+
+    def test_generator(self):
+        assert last(x for x in [5, 6, 7]) == 7
+
+    def test_string(self):
+        assert last("abc") == "c"
+
 
 class TestButlast:
     def test_basic(self):
@@ -107,6 +140,12 @@ class TestDropLast:
     def test_zero(self):
         assert drop_last(0, [1, 2, 3]) == [1, 2, 3]
 
+    def test_more_than_length(self):
+        assert drop_last(5, [1, 2, 3]) == []
+
+    def test_generator(self):
+        assert drop_last(1, (x for x in [1, 2, 3])) == [1, 2]
+
 
 class TestAllkeys:
     def test_flat_dict(self):
@@ -117,6 +156,42 @@ class TestAllkeys:
         assert "b" in result
         assert "c" in result
 
+    def test_order(self):
+        d = {"a": 1, "b": {"c": 1, "d": {"e": 1}, "f": 1}, "g": 1}
+        assert allkeys(d) == ("a", "c", "e", "f", "g")
+
+    def test_self_containing(self):
+        d = {"a": 1}
+        d["self"] = d
+        d["nested"] = {"b": 2, "outer": d}
+        assert allkeys(d) == ("a", "b")
+
+    def test_dict_subclasses(self):
+        d = {"dd": defaultdict(int, k=1), "od": OrderedDict(z=1)}
+        assert allkeys(d) == ("k", "z")
+
+    def test_shared_dict(self):
+        d = {"x": 1}
+        assert allkeys({"a": d, "b": d}) == ("x", "x")
+
+    def test_non_mapping(self):
+        assert allkeys(["a", "b"]) == ()
+
+
+class TestJuxt:
+    def test_basic(self):
+        assert juxt(min, max)([3, 1, 2]) == [1, 3]
+
+    def test_lazy(self):
+        results = juxt_lazy(min, max)([3, 1, 2])
+        assert not isinstance(results, list)
+        assert list(results) == [1, 3]
+
+
+class TestFlip:
+    def test_basic(self):
+        assert flip(divmod)(3, 7) == (2, 1)
+
 
 class TestDistinct:
     def test_basic(self):
@@ -125,6 +200,9 @@ class TestDistinct:
     def test_preserves_order(self):
         assert list(distinct([3, 1, 2, 1, 3])) == [3, 1, 2]
 
+    def test_lazy(self):
+        assert list(itertools.islice(distinct(itertools.count()), 3)) == [0, 1, 2]
+
 
 class TestFlatten:
     def test_basic(self):
@@ -132,3 +210,50 @@ class TestFlatten:
 
     def test_empty(self):
         assert list(flatten([[], []])) == []
+
+
+class TestIdentityKey:
+    def test_same_object(self):
+        obj = []
+        assert IdentityKey(obj) == IdentityKey(obj)
+        assert hash(IdentityKey(obj)) == hash(IdentityKey(obj))
+
+    def test_equal_but_distinct_objects(self):
+        assert IdentityKey([]) != IdentityKey([])
+
+
+class TestCachedAttrs:
+    def test_unmangled(self):
+        class Foo:
+            some_attr = 1
+        assert "some-attr" in cached_attrs(Foo)
+
+    def test_cache_clear(self):
+        class Foo:
+            pass
+        assert "new-attr" not in cached_attrs(Foo)
+        Foo.new_attr = 1
+        clear_attr_cache()
+        assert "new-attr" in cached_attrs(Foo)
+
+
+class TestWordsWithPrefix:
+    def test_prefix_matches(self):
+        words = tuple(sorted(["print", "prin", "pow", "len", "prj"]))
+        assert words_with_prefix(words, "pri") == ("prin", "print")
+
+    def test_empty_prefix(self):
+        words = ("a", "ab", "b")
+        assert words_with_prefix(words, "") == words
+
+    def test_no_match(self):
+        assert words_with_prefix(("print",), "x") == ()
+
+    def test_max_code_point(self):
+        top = chr(sys.maxunicode)
+        words = tuple(sorted(["a", "a" + top, "a" + top + "b", "b", top, top + "c"]))
+        assert words_with_prefix(words, "a" + top) == ("a" + top, "a" + top + "b")
+        assert words_with_prefix(words, top) == (top, top + "c")
+
+    def test_exact_word(self):
+        assert words_with_prefix(("a", "ab", "b"), "ab") == ("ab",)